@@ -9,3 +9,5 @@ generating questions for teams, and validating their responses.
 """
 
 from .challenge import Base69
+
+__all__ = ["Base69"]
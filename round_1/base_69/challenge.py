@@ -9,6 +9,7 @@ generating questions for teams, and validating their responses.
 """
 
 import random
+from functools import cached_property
 from pathlib import Path
 from sample import samples
 from config import SUBMISSION_LINK
@@ -19,7 +20,13 @@ class Base69(Challenge):
     """Represents a question using a custom base-69 encoding."""
 
     RADIX = 69
+    SCRIPT_PATH: Path = Path(__file__).resolve()
     BASE_STRING = "".join(chr(0x1F600 + i) for i in range(RADIX))
+    ORD_TO_INDEX = {ord(char): index for index, char in enumerate(BASE_STRING)}
+    INDEX_TO_CHAR = dict(enumerate(BASE_STRING))
+    # Digits peeled off the big integer per divmod; RADIX ** 10 fits in 64 bits
+    CHUNK_DIGITS = 10
+    CHUNK_BASE = RADIX**CHUNK_DIGITS
 
     def __init__(self):
         super().__init__(points=200, penalty=40, hints=[])
@@ -35,6 +42,13 @@ class Base69(Challenge):
             tuple[int]: The number in the custom radix.
         """
         num_in_radix = []
+        # Split off word-sized chunks first so the costly big-integer divmod
+        # runs once per CHUNK_DIGITS digits, then split each chunk cheaply.
+        while num >= self.CHUNK_BASE:
+            num, chunk = divmod(num, self.CHUNK_BASE)
+            for _ in range(self.CHUNK_DIGITS):
+                chunk, remainder = divmod(chunk, self.RADIX)
+                num_in_radix.append(remainder)
         while num != 0:
             num, remainder = divmod(num, self.RADIX)
             num_in_radix.append(remainder)
@@ -68,7 +82,8 @@ class Base69(Challenge):
         string = string.encode("ascii")
         num = int.from_bytes(string, byteorder="big")
         num_in_radix = self.decimal_to_radix(num)
-        return "".join(self.BASE_STRING[i] for i in num_in_radix)
+        # Every digit is below 256, so map them all in one str.translate pass
+        return bytes(num_in_radix).decode("latin-1").translate(self.INDEX_TO_CHAR)
 
     def decode(self, encoded_string: str) -> str:
         """
@@ -80,7 +95,18 @@ class Base69(Challenge):
         Returns:
             str: The decoded string.
         """
-        num_in_radix = [self.BASE_STRING.index(c) for c in encoded_string]
+        # str.translate passes unmapped characters through unchanged, so reject
+        # them first; the alphabet is one contiguous block of code points
+        if encoded_string and (
+            min(encoded_string) < self.BASE_STRING[0]
+            or max(encoded_string) > self.BASE_STRING[-1]
+        ):
+            raise ValueError(
+                "The encoded string contains characters outside the alphabet."
+            )
+        # Map every character to its digit in one str.translate pass; each
+        # digit is below 256, so the result encodes to one byte per digit
+        num_in_radix = encoded_string.translate(self.ORD_TO_INDEX).encode("latin-1")
         num = self.radix_to_decimal(tuple(num_in_radix))
         length = (num.bit_length() + 7) // 8  # Calculate the number of bytes needed
         return num.to_bytes(length, byteorder="big").decode("ascii")
@@ -95,7 +121,11 @@ class Base69(Challenge):
         Returns:
             tuple[str, str]: The encoded and decoded strings.
         """
-        team = await self.db.get_team(team_id)
+        team = await self.db.teams.find_one(
+            {"team_id": team_id}, {"questions.Base69": 1}
+        )
+        if team is None:
+            raise ValueError(f"Team with ID {team_id} could not be found.")
         encode_string = self.db.get_nested_value(team, "questions.Base69.encode_string")
         decode_string = self.db.get_nested_value(team, "questions.Base69.decode_string")
         if encode_string and decode_string:
@@ -106,8 +136,8 @@ class Base69(Challenge):
         new_samples = samples.copy()
         new_samples.remove(random_string)
         decode_string = random.choice(new_samples)
-        self.db.teams.update_one(
-            {"team_id": team_id},
+        result = await self.db.teams.update_one(
+            {"team_id": team_id, "questions.Base69": {"$exists": False}},
             {
                 "$set": {
                     "questions.Base69": {
@@ -116,14 +146,35 @@ class Base69(Challenge):
                     },
                     "data_to_validate.Base69": {
                         "encoded_string": self.encode(decode_string),
-                        "decoded_string": self.decode(encode_string),
+                        "decoded_string": self.decode(encode_string).strip(),
                     },
                 }
             },
         )
+        if result.matched_count == 0:
+            # Another request stored this team's strings first, so serve those.
+            team = await self.db.teams.find_one(
+                {"team_id": team_id}, {"questions.Base69": 1}
+            )
+            encode_string = self.db.get_nested_value(
+                team, "questions.Base69.encode_string"
+            )
+            decode_string = self.db.get_nested_value(
+                team, "questions.Base69.decode_string"
+            )
 
         return encode_string, decode_string
 
+    @cached_property
+    def question_template(self) -> str:
+        """
+        Load the question template once and reuse it for every team.
+
+        Returns:
+            str: The unformatted question template.
+        """
+        return self.get_question_template(self.SCRIPT_PATH.with_name("question.txt"))
+
     async def generate_question(self, team_id: str) -> dict:
         """
         Generate the full question text for the team.
@@ -134,11 +185,8 @@ class Base69(Challenge):
         Returns:
             dict: The formatted question.
         """
-        script_path = Path(__file__).resolve()
-        path = script_path.with_name("question.txt")
         encode_string, decode_string = await self.get_strings(team_id)
-        question_template = self.get_question_template(path)
-        description = question_template.format(
+        description = self.question_template.format(
             char_set=self.BASE_STRING,
             encode_string=decode_string,
             decode_string=encode_string,
@@ -8,3 +8,5 @@ binary data (haystack).
 """
 
 from .challenge import NeedleInTheHaystack
+
+__all__ = ["NeedleInTheHaystack"]
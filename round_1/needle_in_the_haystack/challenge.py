@@ -7,10 +7,14 @@ string (needle) within a large amount of randomly generated
 binary data (haystack).
 """
 
-from os import makedirs
+from asyncio import to_thread
+from glob import escape as glob_escape
+from os import makedirs, remove, replace, urandom
+from functools import cached_property
+from mmap import mmap, ACCESS_READ
 from pathlib import Path
 from re import compile as re_compile
-from random import randrange, randbytes
+from random import randrange
 
 from config import SUBMISSION_LINK, FILE_LINK
 from ....base_challenge import Challenge
@@ -24,16 +28,38 @@ class NeedleInTheHaystack(Challenge):
     """
 
     FLAG_LENGTH: int = 10
+    FILE_SIZE: int = 1024 * 1024
+    CHUNK_SIZE: int = 64 * 1024
+    NAME_TOKEN_BYTES: int = 8
     SCRIPT_PATH: Path = Path(__file__).resolve()
     QUESTIONS_DIR_LOCATION: Path = SCRIPT_PATH.with_name("questions")
-    # Regular expression pattern to match printable ASCII characters
-    PRINTABLE_ASCII_RE = re_compile(b"[\x20-\x7e]+")
-    FLAG_RE = re_compile(r"flag\{(\w+)\}")
+    FLAG_RE = re_compile(rb"flag\{(\w+)\}")
 
     def __init__(self):
         hints = [(200, "Extract all the strings")]
         super().__init__(points=400, penalty=50, hints=hints)
 
+    def write_haystack(self, location: str, flag: bytes) -> None:
+        """
+        Stream random binary data to a file one chunk at a time,
+        splicing the flag into a randomly chosen chunk.
+
+        Args:
+            location (str): The path of the file to write.
+            flag (bytes): The flag to hide in the data.
+        """
+        chunk_count = self.FILE_SIZE // self.CHUNK_SIZE
+        flag_chunk = randrange(chunk_count)
+        with open(location, "wb") as file:
+            for index in range(chunk_count):
+                if index != flag_chunk:
+                    file.write(urandom(self.CHUNK_SIZE))
+                    continue
+                chunk = bytearray(urandom(self.CHUNK_SIZE - len(flag)))
+                random_position = randrange(len(chunk))
+                chunk[random_position:random_position] = flag
+                file.write(chunk)
+
     async def gen_question(self, team_id: str) -> tuple[str, str]:
         """
         Generate a question for the team.
@@ -44,7 +70,13 @@ class NeedleInTheHaystack(Challenge):
         Returns:
             tuple: A tuple containing the location of the generated file and the flag value.
         """
-        team = await self.db.get_team(team_id)
+        projection = {
+            "questions.NeedleInTheHaystack": 1,
+            "data_to_validate.NeedleInTheHaystack": 1,
+        }
+        team = await self.db.teams.find_one({"team_id": team_id}, projection)
+        if team is None:
+            raise ValueError(f"Team with ID {team_id} could not be found.")
         location = self.db.get_nested_value(
             team, "questions.NeedleInTheHaystack.location"
         )
@@ -58,23 +90,22 @@ class NeedleInTheHaystack(Challenge):
         flag_value = self.generate_random_string(self.FLAG_LENGTH, fixed_length=True)
         flag = (f"flag{{{flag_value}}}").encode("ascii")
 
-        # Generate random binary data
-        binary_data = randbytes(1024 * 1024 - len(flag))
-
-        # Insert flag at a random position
-        random_position = randrange(len(binary_data))
-        binary_data = b"".join(
-            (binary_data[:random_position], flag, binary_data[random_position:])
+        # Each attempt gets its own file, moved into place before it is
+        # recorded, so a location read from the database always exists
+        makedirs(self.QUESTIONS_DIR_LOCATION, exist_ok=True)
+        token = urandom(self.NAME_TOKEN_BYTES).hex()
+        location = str(
+            self.QUESTIONS_DIR_LOCATION / f"NeedleInTheHayStack_{team_id}_{token}"
         )
+        temp_location = f"{location}.part"
 
-        # Save binary data to file
-        makedirs(self.QUESTIONS_DIR_LOCATION, exist_ok=True)
-        location = str(self.QUESTIONS_DIR_LOCATION / f"NeedleInTheHayStack_{team_id}")
-        with open(location, "wb") as file:
-            file.write(binary_data)
+        # Generate and write the file on a worker thread so the event loop
+        # keeps serving; os.urandom releases the GIL while it fills buffers
+        await to_thread(self.write_haystack, temp_location, flag)
+        replace(temp_location, location)
 
-        await self.db.teams.update_one(
-            {"team_id": team_id},
+        result = await self.db.teams.update_one(
+            {"team_id": team_id, "questions.NeedleInTheHaystack": {"$exists": False}},
             {
                 "$set": {
                     "questions.NeedleInTheHaystack": {"location": location},
@@ -82,8 +113,29 @@ class NeedleInTheHaystack(Challenge):
                 }
             },
         )
+        if result.matched_count == 0:
+            # Another request recorded this team's question first, drop this file.
+            remove(location)
+            team = await self.db.teams.find_one({"team_id": team_id}, projection)
+            location = self.db.get_nested_value(
+                team, "questions.NeedleInTheHaystack.location"
+            )
+            flag_value = self.db.get_nested_value(
+                team, "data_to_validate.NeedleInTheHaystack.flag"
+            )
+
         return location, flag_value
 
+    @cached_property
+    def question_template(self) -> str:
+        """
+        Load the question template once and reuse it for every team.
+
+        Returns:
+            str: The unformatted question template.
+        """
+        return self.get_question_template(self.SCRIPT_PATH.with_name("question.txt"))
+
     async def generate_question(self, team_id: str) -> dict:  # pylint: disable = unused-argument
         """
         Generate the full question description for the team.
@@ -94,8 +146,7 @@ class NeedleInTheHaystack(Challenge):
         Returns:
             dict: The formatted question.
         """  # pylint: disable = duplicate-code
-        path = self.SCRIPT_PATH.with_name("question.txt")
-        description = self.get_question_template(path).format(
+        description = self.question_template.format(
             submission_url=SUBMISSION_LINK,
             file_url=FILE_LINK,
             challenge_id=self.challenge_id,
@@ -116,23 +167,39 @@ class NeedleInTheHaystack(Challenge):
         location, _ = await self.gen_question(team_id)
         return location
 
+    def find_question_file(self, team_id: str) -> Path:
+        """
+        Locate the haystack file generated for the team.
+
+        Args:
+            team_id (str): The ID of the team.
+
+        Returns:
+            Path: The path of the team's haystack file.
+        """
+        pattern = f"NeedleInTheHayStack_{glob_escape(team_id)}_" + "[0-9a-f]" * (
+            2 * self.NAME_TOKEN_BYTES
+        )
+        for file_path in self.QUESTIONS_DIR_LOCATION.glob(pattern):
+            return file_path
+        # Files generated before per-attempt names have no token suffix
+        return self.QUESTIONS_DIR_LOCATION / f"NeedleInTheHayStack_{team_id}"
+
     def solution(self, team_id: str) -> str:
         """
-        Extract all the printable strings from a binary file.
+        Search the binary file for the flag.
 
         Args:
             team_id (str): The ID of the team.
 
         Returns:
-            list: A list of strings extracted from the file.
+            str: The flag value, or a message if it could not be found.
         """
-        file_path = self.QUESTIONS_DIR_LOCATION / f"NeedleInTheHayStack_{team_id}"
-        with open(file_path, "rb") as file:
-            binary_data = file.read()
-            matches = self.PRINTABLE_ASCII_RE.finditer(binary_data)
-            for match in matches:
-                string = match.group().decode("ascii")
-                flag_match = self.FLAG_RE.search(string)
-                if flag_match:
-                    return flag_match.group(1)
+        file_path = self.find_question_file(team_id)
+        with open(file_path, "rb") as file, mmap(
+            file.fileno(), 0, access=ACCESS_READ
+        ) as binary_data:
+            flag_match = self.FLAG_RE.search(binary_data)
+            if flag_match:
+                return flag_match.group(1).decode("ascii")
         return "Flag not Found"
@@ -10,3 +10,5 @@ retrieve the flag.
 """
 
 from .challenge import RandomSequence
+
+__all__ = ["RandomSequence"]
@@ -9,9 +9,12 @@ format. Participants must decode the hexadecimal sequence to
 retrieve the flag.
 """
 
-from os import makedirs
+from asyncio import to_thread
+from glob import escape as glob_escape
+from os import makedirs, remove, replace, urandom
 from re import compile as re_compile
 from random import sample, randint
+from functools import cached_property
 from pathlib import Path
 
 from sample import samples
@@ -31,6 +34,7 @@ class RandomSequence(Challenge):
     FLAG_RE = re_compile(r"flag\{(\w+)\}")
     SCRIPT_PATH: Path = Path(__file__).resolve()
     FILES_DIR_LOCATION: Path = SCRIPT_PATH.with_name("files")
+    NAME_TOKEN_BYTES: int = 8
 
     def __init__(self):
         hints = [(40, "Heard the term 'HEX'?")]
@@ -47,7 +51,21 @@ class RandomSequence(Challenge):
         Returns:
             str: The hexadecimal representation of the text.
         """
-        return " ".join(hex(ord(char))[2:] for char in text)
+        return text.encode("ascii").hex(" ")
+
+    def write_sequence(self, location: str, flag: str) -> None:
+        """
+        Embed the flag within random text and write it to a file in
+        hexadecimal format.
+
+        Args:
+            location (str): The path of the file to write.
+            flag (str): The flag to hide in the text.
+        """
+        parts = sample(samples, 10)
+        parts.insert(randint(0, len(parts)), flag)
+        with open(location, "w", encoding="utf-8") as file:
+            file.write(self.text_to_hex("".join(parts)))
 
     async def gen_question(self, team_id: str) -> tuple[str, str]:
         """
@@ -60,7 +78,13 @@ class RandomSequence(Challenge):
         Returns:
             tuple: A tuple containing the location of the file and the flag value.
         """
-        team = await self.db.get_team(team_id)
+        projection = {
+            "questions.RandomSequence": 1,
+            "data_to_validate.RandomSequence": 1,
+        }
+        team = await self.db.teams.find_one({"team_id": team_id}, projection)
+        if team is None:
+            raise ValueError(f"Team with ID {team_id} could not be found.")
         location = self.db.get_nested_value(team, "questions.RandomSequence.location")
         flag_value = self.db.get_nested_value(
             team, "data_to_validate.RandomSequence.flag"
@@ -70,16 +94,18 @@ class RandomSequence(Challenge):
 
         flag_value = self.generate_random_string(self.FLAG_LENGTH, fixed_length=True)
         flag = f"flag{{{flag_value}}}"
-        data = "".join(sample(samples, 10))
-        random_position = randint(0, len(data))
-        data = data[:random_position] + flag + data[random_position:]
+        # Each attempt gets its own file, moved into place before it is
+        # recorded, so a location read from the database always exists
         makedirs(self.FILES_DIR_LOCATION, exist_ok=True)
-        location = str(self.FILES_DIR_LOCATION / f"RandomSequence_{team_id}")
-        with open(location, "w", encoding="utf-8") as file:
-            file.write(self.text_to_hex(data))
-
-        await self.db.teams.update_one(
-            {"team_id": team_id},
+        token = urandom(self.NAME_TOKEN_BYTES).hex()
+        location = str(self.FILES_DIR_LOCATION / f"RandomSequence_{team_id}_{token}")
+        temp_location = f"{location}.part"
+        # Build and write the file on a worker thread so the event loop keeps serving
+        await to_thread(self.write_sequence, temp_location, flag)
+        replace(temp_location, location)
+
+        result = await self.db.teams.update_one(
+            {"team_id": team_id, "questions.RandomSequence": {"$exists": False}},
             {
                 "$set": {
                     "questions.RandomSequence": {"location": location},
@@ -87,8 +113,29 @@ class RandomSequence(Challenge):
                 }
             },
         )
+        if result.matched_count == 0:
+            # Another request recorded this team's question first, drop this file.
+            remove(location)
+            team = await self.db.teams.find_one({"team_id": team_id}, projection)
+            location = self.db.get_nested_value(
+                team, "questions.RandomSequence.location"
+            )
+            flag_value = self.db.get_nested_value(
+                team, "data_to_validate.RandomSequence.flag"
+            )
+
         return location, flag_value
 
+    @cached_property
+    def question_template(self) -> str:
+        """
+        Load the question template once and reuse it for every team.
+
+        Returns:
+            str: The unformatted question template.
+        """
+        return self.get_question_template(self.SCRIPT_PATH.with_name("question.txt"))
+
     async def generate_question(self, team_id: str) -> dict:  # pylint: disable=unused-argument
         """
         Generate the full question description for the team.
@@ -99,8 +146,7 @@ class RandomSequence(Challenge):
         Returns:
             dict: The formatted question.
         """
-        path = self.SCRIPT_PATH.with_name("question.txt")
-        description = self.get_question_template(path).format(
+        description = self.question_template.format(
             file_url=FILE_LINK,
             submission_url=SUBMISSION_LINK,
             challenge_id=self.challenge_id,
@@ -132,7 +178,27 @@ class RandomSequence(Challenge):
         Returns:
             str: The text representation of the hexadecimal string.
         """
-        return "".join(chr(int(hex_char, 16)) for hex_char in hex_string.split(" "))
+        # Files written before text_to_hex padded its codes hold single-digit
+        # values such as "a", which bytes.fromhex rejects
+        return bytes(int(code, 16) for code in hex_string.split()).decode("ascii")
+
+    def find_question_file(self, team_id: str) -> Path:
+        """
+        Locate the sequence file generated for the team.
+
+        Args:
+            team_id (str): The ID of the team.
+
+        Returns:
+            Path: The path of the team's sequence file.
+        """
+        pattern = f"RandomSequence_{glob_escape(team_id)}_" + "[0-9a-f]" * (
+            2 * self.NAME_TOKEN_BYTES
+        )
+        for file_path in self.FILES_DIR_LOCATION.glob(pattern):
+            return file_path
+        # Files generated before per-attempt names have no token suffix
+        return self.FILES_DIR_LOCATION / f"RandomSequence_{team_id}"
 
     def solution(self, team_id: str) -> str:
         """
@@ -144,9 +210,7 @@ class RandomSequence(Challenge):
         Returns:
             str: The extracted flag or a message indicating no flag was found.
         """
-        with open(
-            self.FILES_DIR_LOCATION / f"RandomSequence_{team_id}", "r", encoding="utf-8"
-        ) as file:
+        with open(self.find_question_file(team_id), "r", encoding="utf-8") as file:
             data = self.hex_to_text(file.read())
             match = self.FLAG_RE.search(data)
             if match:
@@ -7,3 +7,5 @@ multiple files that share common characteristics.
 """
 
 from .challenge import TheBlackSheep
+
+__all__ = ["TheBlackSheep"]
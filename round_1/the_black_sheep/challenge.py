@@ -7,10 +7,13 @@ multiple files that share common characteristics.
 """
 
 import os
-from random import choice
-from shutil import copyfile, rmtree
-from hashlib import sha256
+from random import randrange
+from shutil import rmtree
+from hashlib import new as new_hash
+from functools import cached_property
+from mmap import mmap, ACCESS_READ
 from pathlib import Path
+from zipfile import ZipFile, ZIP_DEFLATED
 
 from config import SUBMISSION_LINK, FILE_LINK
 from ....base_challenge import Challenge
@@ -41,7 +44,12 @@ class TheBlackSheep(Challenge):
         Returns:
             tuple: A tuple containing the location of the zip file and the unique file name.
         """
-        team = await self.db.get_team(team_id)
+        team = await self.db.teams.find_one(
+            {"team_id": team_id},
+            {"questions.TheBlackSheep": 1, "data_to_validate.TheBlackSheep": 1},
+        )
+        if team is None:
+            raise ValueError(f"Team with ID {team_id} could not be found.")
         location = self.db.get_nested_value(team, "questions.TheBlackSheep.location")
         file_name = self.db.get_nested_value(
             team, "data_to_validate.TheBlackSheep.file_name"
@@ -49,23 +57,28 @@ class TheBlackSheep(Challenge):
         if location and file_name:
             return location, file_name
 
-        common_file_location = self.UTILS_DIR_LOCATION / "common"
-        unique_file_location = self.UTILS_DIR_LOCATION / "unique"
-        os.makedirs(self.QUESTIONS_DIR_LOCATION, exist_ok=True)
-        final_dir = self.QUESTIONS_DIR_LOCATION / f"TheBlackSheep_{team_id}"
-        os.makedirs(final_dir, exist_ok=True)
+        common_file_data = (self.UTILS_DIR_LOCATION / "common").read_bytes()
+        unique_file_data = (self.UTILS_DIR_LOCATION / "unique").read_bytes()
 
+        # Draw the entropy for all names at once and slice it into 20-character
+        # hex names; the loop only repeats in the unlikely case of a collision
         files = set()
         while len(files) != 100:
-            files.add(self.generate_random_string(20))
+            entropy = os.urandom((100 - len(files)) * 10).hex()
+            files |= {entropy[i : i + 20] for i in range(0, len(entropy), 20)}
         common_files = list(files)
-        unique_file = choice(common_files)
-        common_files.remove(unique_file)
-        for file in common_files:
-            copyfile(common_file_location, final_dir / file)
-        copyfile(unique_file_location, final_dir / unique_file)
-        zip_location = f"{final_dir}.zip"
-        self.zip_folder(final_dir, zip_location)
+        # Swap a random name to the end so it can be popped without a scan
+        index = randrange(len(common_files))
+        common_files[index], common_files[-1] = common_files[-1], common_files[index]
+        unique_file = common_files.pop()
+
+        # Write the archive entries straight from memory, no staging directory
+        os.makedirs(self.QUESTIONS_DIR_LOCATION, exist_ok=True)
+        zip_location = str(self.QUESTIONS_DIR_LOCATION / f"TheBlackSheep_{team_id}.zip")
+        with ZipFile(zip_location, "w", ZIP_DEFLATED, compresslevel=1) as zip_file:
+            for file in common_files:
+                zip_file.writestr(file, common_file_data)
+            zip_file.writestr(unique_file, unique_file_data)
 
         await self.db.teams.update_one(
             {"team_id": team_id},
@@ -76,12 +89,18 @@ class TheBlackSheep(Challenge):
                 }
             },
         )
-        try:
-            rmtree(final_dir)
-        except Exception as e:  # pylint: disable = broad-exception-caught
-            print(f"Error cleaning up directory: {e}")
         return zip_location, unique_file
 
+    @cached_property
+    def question_template(self) -> str:
+        """
+        Load the question template once and reuse it for every team.
+
+        Returns:
+            str: The unformatted question template.
+        """
+        return self.get_question_template(self.SCRIPT_PATH.with_name("question.txt"))
+
     async def generate_question(self, team_id: str) -> dict:  # pylint: disable = unused-argument
         """
         Generate the full question description for the team.
@@ -92,8 +111,7 @@ class TheBlackSheep(Challenge):
         Returns:
             dict: The formatted question.
         """  # pylint: disable = duplicate-code
-        path = self.SCRIPT_PATH.with_name("question.txt")
-        description = self.get_question_template(path).format(
+        description = self.question_template.format(
             submission_url=SUBMISSION_LINK,
             file_url=FILE_LINK,
             challenge_id=self.challenge_id,
@@ -125,12 +143,15 @@ class TheBlackSheep(Challenge):
         Returns:
             str: The SHA-256 hash of the file.
         """
-        sha256_hash = sha256()
-        # Open the file in binary mode and read it in chunks
+        # The hash only tests for equal contents, so let OpenSSL pick its
+        # fastest implementation instead of a FIPS-restricted one
+        sha256_hash = new_hash("sha256", usedforsecurity=False)
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        # Return the hexadecimal representation of the hash
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size:
+                # Hash the whole mapping in a single update, without copying it
+                with mmap(f.fileno(), 0, access=ACCESS_READ) as mapped:
+                    sha256_hash.update(mapped)
         return sha256_hash.hexdigest()
 
     def solution(self, team_id: str) -> str:
@@ -8,3 +8,5 @@ file to determine the count of characters it contains.
 """
 
 from .challenge import TheInvisibleMen
+
+__all__ = ["TheInvisibleMen"]
@@ -9,6 +9,7 @@ file to determine the count of characters it contains.
 
 import os
 import random
+from functools import cached_property
 from pathlib import Path
 from shutil import rmtree
 
@@ -101,11 +102,16 @@ class TheInvisibleMen(Challenge):
                 the count of characters in the main file.
         """
 
-        team = await self.db.get_team(team_id)
+        team = await self.db.teams.find_one(
+            {"team_id": team_id},
+            {"questions.TheInvisibleMen": 1, "data_to_validate.TheInvisibleMen": 1},
+        )
+        if team is None:
+            raise ValueError(f"Team with ID {team_id} could not be found.")
         location = self.db.get_nested_value(team, "questions.TheInvisibleMen.location")
         count = self.db.get_nested_value(team, "data_to_validate.TheInvisibleMen.count")
         if location and count:
-            return location, count
+            return location, int(count)
 
         os.makedirs(self.QUESTIONS_DIR_LOCATION, exist_ok=True)
         location = self.QUESTIONS_DIR_LOCATION / f"TheInvisibleMen_{team_id}"
@@ -130,7 +136,7 @@ class TheInvisibleMen(Challenge):
             {
                 "$set": {
                     "questions.TheInvisibleMen": {"location": zip_location},
-                    "data_to_validate.TheInvisibleMen": {"count": count},
+                    "data_to_validate.TheInvisibleMen": {"count": str(count)},
                 }
             },
         )
@@ -169,6 +175,16 @@ class TheInvisibleMen(Challenge):
         location, _ = await self.create_files(team_id)
         return location
 
+    @cached_property
+    def question_template(self) -> str:
+        """
+        Load the question template once and reuse it for every team.
+
+        Returns:
+            str: The unformatted question template.
+        """
+        return self.get_question_template(self.SCRIPT_PATH.with_name("question.txt"))
+
     async def generate_question(self, team_id: str) -> dict:  # pylint: disable = unused-argument
         """
         Generate the question for the challenge.
@@ -179,8 +195,7 @@ class TheInvisibleMen(Challenge):
         Returns:
             dict: The formatted question.
         """  # pylint: disable = duplicate-code
-        path = self.SCRIPT_PATH.with_name("question.txt")
-        description = self.get_question_template(path).format(
+        description = self.question_template.format(
             submission_url=SUBMISSION_LINK,
             file_url=FILE_LINK,
             challenge_id=self.challenge_id,
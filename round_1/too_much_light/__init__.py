@@ -8,3 +8,5 @@ the question, validating the response, and providing the solution.
 """
 
 from .challenge import TooMuchLight
+
+__all__ = ["TooMuchLight"]
@@ -7,9 +7,10 @@ a flag in an image. The class provides methods for generating
 the question, validating the response, and providing the solution.
 """
 
+from functools import cached_property
 from pathlib import Path
 from random import randint
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 from config import SUBMISSION_LINK, FILE_LINK
 from ....base_challenge import Challenge
 
@@ -22,8 +23,13 @@ class TooMuchLight(Challenge):
 
     FLAG_LENGTH = 10
     FONT_SIZE: int = 50
+    # Flag and background colours as RGB tuples (0xFFFEFF on 0xFFFFFF)
+    FG_COLOR: tuple[int, int, int] = (0xFF, 0xFE, 0xFF)
+    BG_COLOR: tuple[int, int, int] = (0xFF, 0xFF, 0xFF)
     SCRIPT_PATH: Path = Path(__file__).resolve()
     IMAGE_DIR_LOCATION: Path = SCRIPT_PATH.with_name("images")
+    # Lookup table that keeps only full intensity, used to mask white pixels
+    WHITE_MASK_LUT: list[int] = [0] * 255 + [255]
 
     def __init__(self):
         hints = [
@@ -36,19 +42,6 @@ class TooMuchLight(Challenge):
         ]
         super().__init__(points=500, penalty=100, hints=hints)
 
-    @staticmethod
-    def hex_color_to_rgb(color: int) -> tuple[int, int, int]:
-        """
-        Convert a hexadecimal color value to an RGB tuple.
-
-        Args:
-            color (int): The color in hexadecimal format (e.g., 0xRRGGBB).
-
-        Returns:
-            tuple[int, int, int]: A tuple containing the RGB values (red, green, blue).
-        """
-        return (color >> 16 & 0xFF, color >> 8 & 0xFF, color & 0xFF)
-
     def generate_flag(self) -> tuple[str, str]:
         """
         Generate the flag value for the question.
@@ -63,6 +56,28 @@ class TooMuchLight(Challenge):
         flag = f"flag{{{flag_value}}}"
         return flag, flag_value
 
+    @cached_property
+    def font(self) -> ImageFont.FreeTypeFont:
+        """
+        Load the flag font once and reuse it for every image.
+
+        Returns:
+            ImageFont.FreeTypeFont: The font used to draw the flag.
+        """
+        font_path = self.SCRIPT_PATH.with_name("JetBrainsMono-Medium.ttf")
+        return ImageFont.truetype(str(font_path), self.FONT_SIZE)
+
+    @cached_property
+    def flag_height(self) -> int:
+        """
+        Measure the line height of the flag font once.
+
+        Returns:
+            int: The sum of the font's ascent and descent.
+        """
+        ascent, descent = self.font.getmetrics()
+        return ascent + descent
+
     def generate_image(self, team_id: str, flag: str) -> str:
         """
         Generate the image with the flag and return the image location.
@@ -74,26 +89,21 @@ class TooMuchLight(Challenge):
         Returns:
             str: The location of the generated image.
         """
-        fg_color = 0xFFFEFF
-        bg_color = 0xFFFFFF
         image_size = (1337, 1337)
 
-        font_path = self.SCRIPT_PATH.with_name("JetBrainsMono-Medium.ttf")
-        font = ImageFont.truetype(str(font_path), self.FONT_SIZE)
-        metrics = font.getmetrics()
+        font = self.font
         flag_length = font.getlength(flag)
-        flag_height = metrics[0] + metrics[1]
         position = (
             randint(0, int(image_size[0] - flag_length)),
-            randint(0, int(image_size[1] - flag_height)),
+            randint(0, int(image_size[1] - self.flag_height)),
         )
 
-        with Image.new("RGB", image_size, self.hex_color_to_rgb(bg_color)) as im:
+        with Image.new("RGB", image_size, self.BG_COLOR) as im:
             draw = ImageDraw.Draw(im)
-            draw.text(position, flag, font=font, fill=self.hex_color_to_rgb(fg_color))
+            draw.text(position, flag, font=font, fill=self.FG_COLOR)
             self.IMAGE_DIR_LOCATION.mkdir(exist_ok=True)
             location = self.IMAGE_DIR_LOCATION / f"TooMuchLight_{team_id}.png"
-            im.save(location, "PNG")
+            im.save(location, "PNG", compress_level=1)
         return str(location)
 
     async def get_question(self, team_id: str) -> tuple[str, str]:
@@ -106,7 +116,12 @@ class TooMuchLight(Challenge):
         Returns:
             tuple[str, str]: the image location and flag value.
         """
-        team = await self.db.get_team(team_id)
+        team = await self.db.teams.find_one(
+            {"team_id": team_id},
+            {"questions.TooMuchLight": 1, "data_to_validate.TooMuchLight": 1},
+        )
+        if team is None:
+            raise ValueError(f"Team with ID {team_id} could not be found.")
         location = self.db.get_nested_value(team, "questions.TooMuchLight.location")
         flag_value = self.db.get_nested_value(
             team, "data_to_validate.TooMuchLight.flag"
@@ -141,6 +156,16 @@ class TooMuchLight(Challenge):
         location, _ = await self.get_question(team_id)
         return location
 
+    @cached_property
+    def question_template(self) -> str:
+        """
+        Load the question template once and reuse it for every team.
+
+        Returns:
+            str: The unformatted question template.
+        """
+        return self.get_question_template(self.SCRIPT_PATH.with_name("question.txt"))
+
     async def generate_question(self, team_id: str) -> dict:  # pylint: disable=unused-argument
         """
         Generate the full question text for the team.
@@ -151,9 +176,7 @@ class TooMuchLight(Challenge):
         Returns:
             dict: The formatted question.
         """  # pylint: disable = duplicate-code
-        path = self.SCRIPT_PATH.with_name("question.txt")
-        question_template = self.get_question_template(path)
-        description = question_template.format(
+        description = self.question_template.format(
             submission_url=SUBMISSION_LINK,
             file_url=FILE_LINK,
             challenge_id=self.challenge_id,
@@ -172,16 +195,15 @@ class TooMuchLight(Challenge):
             str: The location of the generated solution image.
         """
         imput_img_path = self.IMAGE_DIR_LOCATION / f"TooMuchLight_{team_id}.png"
-        img = Image.open(imput_img_path)
-        size = img.size
-        pixels = list(img.getdata())
-        for index, value in enumerate(pixels):
-            if value == (255, 255, 255):
-                pixels[index] = (0, 0, 0)
-        img = Image.new("RGBA", size)
-        img.putdata(pixels)
+        with Image.open(imput_img_path) as img:
+            solution_img = img.convert("RGB")
+        # A pixel is pure white exactly when its darkest channel is 255
+        red, green, blue = solution_img.split()
+        darkest = ImageChops.darker(ImageChops.darker(red, green), blue)
+        white_mask = darkest.point(self.WHITE_MASK_LUT)
+        solution_img.paste((0, 0, 0), mask=white_mask)
         ouput_img_path = (
             self.IMAGE_DIR_LOCATION / f"TooMuchLight_{team_id}_solution.png"
         )
-        img.save(ouput_img_path)
+        solution_img.save(ouput_img_path, "PNG", compress_level=1)
         return ouput_img_path